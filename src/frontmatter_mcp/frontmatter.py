@@ -1,12 +1,133 @@
 """Frontmatter read/write module."""
 
+import copy
+import mmap
+import os
+import re
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice, repeat
 from pathlib import Path
 from typing import Any
 
 import frontmatter
+import yaml
 
+# Upper bound on worker threads used by parse_files. Threads overlap the
+# blocking open/stat/read calls, which release the GIL; YAML parsing itself
+# holds it, so there is little gain once files are in the page cache.
+MAX_PARSE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
-def parse_file(path: Path, base_dir: Path) -> dict[str, Any]:
+# Inputs with fewer paths than this are parsed serially, where starting the
+# thread pool would cost more than it saves
+MIN_PARALLEL_FILES = 64
+
+# Files modified within this window may change again without their mtime
+# moving on coarse-grained filesystems (FAT, HFS+, some network mounts), so
+# they are not cached. This is the same problem as git's racy index.
+RACY_WINDOW_NS = 2_000_000_000
+
+# Path -> (mtime_ns, size, parsed metadata) of every file parsed so far.
+# Holds one entry per file so that scans larger than any fixed LRU bound
+# still hit on every unchanged file; an entry is replaced when its file
+# changes and dropped when the file can no longer be read.
+_parse_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+# Same loader python-frontmatter uses, preferring the libyaml binding
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# YAML header of a file opening with a bare '---' line. The closing
+# delimiter matches python-frontmatter's YAML boundary.
+_YAML_HEADER = re.compile(rb"\A---\r?\n(.*?)^-{3,}[ \t\r]*$", re.DOTALL | re.MULTILINE)
+
+_READ_CHUNK_SIZE = 8192
+
+# First bytes after which python-frontmatter cannot find a header: printable
+# ASCII other than the YAML, TOML and JSON openers. Leading whitespace is
+# stripped before detection, so it is left to the fallback.
+_NO_FRONTMATTER_START = frozenset(range(0x21, 0x7F)) - frozenset(b"-+{")
+
+
+def _fast_load(path: str) -> dict[str, Any]:
+    """Load frontmatter metadata by reading only the YAML header.
+
+    Handles files that start with a '---' line by matching a compiled header
+    pattern against the first chunk of the file. Headers that extend past
+    that chunk are matched against a memory map of the file, so the body is
+    never copied or decoded. Files that cannot start a frontmatter block are
+    answered from their first byte. Anything else falls back to
+    frontmatter.load.
+    """
+    with open(path, "rb") as f:
+        buf = f.read(_READ_CHUNK_SIZE)
+        if not buf.startswith(b"---"):
+            if not buf or buf[0] in _NO_FRONTMATTER_START:
+                return {}
+            return frontmatter.load(path).metadata
+        if not buf.startswith((b"---\n", b"---\r\n")):
+            return frontmatter.load(path).metadata
+
+        match = _YAML_HEADER.match(buf)
+        # A short read means the whole file is in buf. Otherwise a match at
+        # the end of buf may be a partial line.
+        if len(buf) == _READ_CHUNK_SIZE and (match is None or match.end() == len(buf)):
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                match = _YAML_HEADER.match(mapped)
+                header = match.group(1) if match else None
+        else:
+            header = match.group(1) if match else None
+
+    if header is None:
+        # Unterminated header
+        return frontmatter.load(path).metadata
+    text = header.decode("utf-8").replace("\r\n", "\n")
+    metadata = yaml.load(text, Loader=_YAML_LOADER)
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _load_cached(path: str) -> dict[str, Any]:
+    """Load frontmatter metadata, memoized by file identity.
+
+    The cached entry is reused while the file's mtime_ns and size are
+    unchanged. Files modified within RACY_WINDOW_NS are parsed but not
+    cached, since a same-size rewrite may keep their mtime. Top-level
+    arrays are stored as tuples. Callers must not mutate the returned dict.
+    """
+    now_ns = time.time_ns()
+    try:
+        st = os.stat(path)
+    except OSError:
+        _parse_cache.pop(path, None)
+        raise
+    entry = _parse_cache.get(path)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    metadata = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in _fast_load(path).items()
+    }
+    if st.st_mtime_ns > now_ns - RACY_WINDOW_NS:
+        _parse_cache.pop(path, None)
+    else:
+        _parse_cache[path] = (st.st_mtime_ns, st.st_size, metadata)
+    return metadata
+
+
+def _relpath(path: str | Path, base_dir: str | Path) -> str:
+    """Get the path of a file relative to the base directory.
+
+    Raises:
+        ValueError: If the path is not within the base directory.
+    """
+    rel = os.path.relpath(path, base_dir)
+    if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+        raise ValueError(f"{path} is not within {base_dir}")
+    return rel
+
+
+def parse_file(path: str | Path, base_dir: str | Path) -> dict[str, Any]:
     """Parse frontmatter from a single file.
 
     Args:
@@ -15,22 +136,46 @@ def parse_file(path: Path, base_dir: Path) -> dict[str, Any]:
 
     Returns:
         Dictionary with 'path' (relative) and frontmatter properties.
+        Top-level arrays are returned as tuples.
     """
-    post = frontmatter.load(path)
+    path = os.fspath(path)
+    metadata = _load_cached(path)
     result: dict[str, Any] = {
-        "path": str(path.relative_to(base_dir)),
+        "path": _relpath(path, base_dir),
     }
-    result.update(post.metadata)
+    result.update(copy.deepcopy(metadata))
     return result
 
 
+def _parse_one(
+    path: str | Path, base_dir: str | Path
+) -> tuple[dict[str, Any] | None, dict[str, str] | None]:
+    """Parse a single file, capturing any error as a warning.
+
+    Returns:
+        Tuple of (parsed record, None) on success or (None, warning) on failure.
+    """
+    try:
+        return parse_file(path, base_dir), None
+    except Exception as e:
+        return None, {
+            "path": os.path.relpath(path, base_dir),
+            "error": str(e),
+        }
+
+
 def parse_files(
-    paths: list[Path], base_dir: Path
+    paths: Iterable[str | Path], base_dir: str | Path
 ) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
     """Parse frontmatter from multiple files.
 
+    Larger inputs are read concurrently on a thread pool; records and
+    warnings keep the order of the input paths. Paths may be a lazy
+    iterator, in which case parsing overlaps with producing the remaining
+    paths.
+
     Args:
-        paths: List of absolute paths to files.
+        paths: Absolute paths to files.
         base_dir: Base directory for relative path calculation.
 
     Returns:
@@ -39,17 +184,22 @@ def parse_files(
     records: list[dict[str, Any]] = []
     warnings: list[dict[str, str]] = []
 
-    for path in paths:
-        try:
-            record = parse_file(path, base_dir)
-            records.append(record)
-        except Exception as e:
-            warnings.append(
-                {
-                    "path": str(path.relative_to(base_dir)),
-                    "error": str(e),
-                }
-            )
+    def collect(
+        results: Iterable[tuple[dict[str, Any] | None, dict[str, str] | None]],
+    ) -> None:
+        for record, warning in results:
+            if record is not None:
+                records.append(record)
+            if warning is not None:
+                warnings.append(warning)
+
+    paths = iter(paths)
+    first = list(islice(paths, MIN_PARALLEL_FILES))
+    if len(first) < MIN_PARALLEL_FILES:
+        collect(map(_parse_one, first, repeat(base_dir)))
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_PARSE_WORKERS) as executor:
+            collect(executor.map(_parse_one, chain(first, paths), repeat(base_dir)))
 
     return records, warnings
 
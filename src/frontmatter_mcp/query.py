@@ -1,37 +1,77 @@
 """DuckDB query execution module."""
 
 import json
+import os
 from typing import Any
 
 import duckdb
 import pyarrow as pa
 
+from frontmatter_mcp.schema import infer_column_types
+
+# Default cap on the number of result rows returned by execute_query
+MAX_RESULT_ROWS = 100_000
+
+# Arrow types for the type names produced by schema.infer_type
+_ARROW_TYPES: dict[str, pa.DataType] = {
+    "string": pa.string(),
+    "integer": pa.int64(),
+    "boolean": pa.bool_(),
+    "double": pa.float64(),
+    "date": pa.date32(),
+    "timestamp": pa.timestamp("us"),
+    "array": pa.list_(pa.string()),
+}
+
 
 def _serialize_value(value: Any) -> str | None:
     """Serialize a value to string for DuckDB.
 
-    Arrays are JSON-encoded, other values are converted to string.
-    None remains None.
+    Used for columns with mixed types. Arrays are JSON-encoded, other
+    values are converted to string. None remains None.
     """
     if value is None:
         return None
-    if isinstance(value, list):
+    if isinstance(value, (tuple, list)):
         return json.dumps(value, ensure_ascii=False)
     return str(value)
 
 
-def execute_query(records: list[dict[str, Any]], sql: str) -> dict[str, Any]:
+def _build_column(records: list[dict[str, Any]], key: str, type_name: str) -> pa.Array:
+    """Build an Arrow array for one column with its inferred type.
+
+    Values are first converted natively by pyarrow, which also covers
+    "string" columns holding only strings. Mixed columns, and values that
+    do not fit the inferred type (e.g. an integer out of int64 range), fall
+    back to serialized strings.
+    """
+    values = [record.get(key) for record in records]
+    try:
+        return pa.array(values, type=_ARROW_TYPES[type_name])
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        pass
+    return pa.array([_serialize_value(v) for v in values], type=pa.string())
+
+
+def execute_query(
+    records: list[dict[str, Any]], sql: str, max_rows: int = MAX_RESULT_ROWS
+) -> dict[str, Any]:
     """Execute DuckDB SQL query on frontmatter records.
 
-    All values are passed as strings to DuckDB. Use TRY_CAST in SQL
-    for type conversion. Arrays are JSON-encoded strings.
+    Each column gets a native DuckDB type inferred from its values
+    (VARCHAR, BIGINT, BOOLEAN, DOUBLE, DATE, TIMESTAMP or VARCHAR[]).
+    Columns with mixed types are passed as strings, with arrays
+    JSON-encoded.
 
     Args:
         records: List of parsed frontmatter records.
         sql: SQL query string. Must reference 'files' table.
+        max_rows: Maximum number of result rows to return.
 
     Returns:
-        Dictionary with results, row_count, and columns.
+        Dictionary with results, row_count, and columns. If the query
+        produced more than max_rows rows, only the first max_rows are
+        returned and 'truncated' is set to True.
     """
     if not records:
         return {
@@ -40,35 +80,40 @@ def execute_query(records: list[dict[str, Any]], sql: str) -> dict[str, Any]:
             "columns": [],
         }
 
-    # Collect all unique keys across all records
-    all_keys: set[str] = set()
-    for record in records:
-        all_keys.update(record.keys())
+    column_types = infer_column_types(records)
 
-    # Build columns dict with serialized string values
-    columns_data: dict[str, list[str | None]] = {key: [] for key in all_keys}
-    for record in records:
-        for key in all_keys:
-            columns_data[key].append(_serialize_value(record.get(key)))
+    # Build one typed array per column directly from the records
+    names = list(column_types)
+    arrays = [_build_column(records, key, column_types[key]) for key in names]
+    # DuckDB's Arrow scan pays per-batch overhead, so make sure the table
+    # is handed over as a single contiguous chunk per column
+    table = pa.Table.from_arrays(arrays, names=names).combine_chunks()
 
-    # Create pyarrow table with explicit string type for all columns
-    schema = pa.schema([(key, pa.string()) for key in all_keys])
-    table = pa.table(columns_data, schema=schema)
+    # Each query runs in a fresh in-memory database, so tables, macros and
+    # settings created by the SQL do not outlive the call
+    with duckdb.connect(":memory:") as conn:
+        conn.execute(f"PRAGMA threads={os.cpu_count() or 1}")
+        conn.register("files", table)
 
-    # Create connection and register table
-    conn = duckdb.connect(":memory:")
-    conn.register("files", table)
+        # Execute query. Only convert one row past the limit to Python,
+        # which is enough to tell whether the result was truncated.
+        result = conn.execute(sql)
+        columns = [desc[0] for desc in result.description]
+        rows = result.fetchmany(max_rows + 1)
 
-    # Execute query
-    result = conn.execute(sql)
-    columns = [desc[0] for desc in result.description]
-    rows = result.fetchall()
+    truncated = len(rows) > max_rows
+    if truncated:
+        del rows[max_rows:]
 
     # Convert to list of dicts
     results = [dict(zip(columns, row, strict=True)) for row in rows]
 
-    return {
+    response: dict[str, Any] = {
         "results": results,
         "row_count": len(results),
         "columns": columns,
     }
+    if truncated:
+        response["truncated"] = True
+
+    return response
@@ -1,58 +1,168 @@
 """Schema inference module."""
 
+from datetime import date, datetime
 from typing import Any
 
+# Type names for values of common concrete types, looked up by exact type
+_TYPE_MAP: dict[type, str] = {
+    str: "string",
+    int: "integer",
+    bool: "boolean",
+    float: "double",
+    date: "date",
+}
+
+
+def infer_type(value: Any) -> str:
+    """Infer the column type name of a single non-null value.
+
+    Returns one of "string", "integer", "boolean", "double", "date",
+    "timestamp" or "array". Arrays (tuples or lists) must contain only
+    strings; other arrays, timezone-aware datetimes and unknown types are
+    reported as "string".
+    """
+    value_type = type(value)
+    type_name = _TYPE_MAP.get(value_type)
+    if type_name is not None:
+        return type_name
+    if value_type is datetime:
+        return "timestamp" if value.tzinfo is None else "string"
+    if value_type is tuple or value_type is list:
+        return "array" if all(type(v) is str for v in value) else "string"
+
+    # Subclasses of the types above. bool and datetime are subclasses of
+    # int and date, so they are checked first.
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, datetime):
+        return "timestamp" if value.tzinfo is None else "string"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, (tuple, list)):
+        return "array" if all(isinstance(v, str) for v in value) else "string"
+    return "string"
+
+
+def _merge_type(current: str | None, new: str) -> str:
+    """Combine the type seen so far for a column with a new value's type.
+
+    Integers widen to doubles; any other mismatch falls back to "string".
+    """
+    if current is None or current == new:
+        return new
+    if {current, new} == {"integer", "double"}:
+        return "double"
+    return "string"
+
+
+def infer_column_types(records: list[dict[str, Any]]) -> dict[str, str]:
+    """Infer a type name for every column across records.
+
+    Args:
+        records: List of parsed frontmatter records.
+
+    Returns:
+        Dict of column name to type name, in order of first appearance.
+        Columns with only null values are "string".
+    """
+    types: dict[str, str | None] = {}
+    # Python type of the last value merged into each column
+    value_types: dict[str, type] = {}
+
+    for record in records:
+        for key, value in record.items():
+            current = types.get(key)
+            if current == "string":
+                continue
+            if value is None:
+                types.setdefault(key, None)
+                continue
+            value_type = type(value)
+            if value_type is value_types.get(key) and value_type in _TYPE_MAP:
+                continue
+            types[key] = _merge_type(current, infer_type(value))
+            value_types[key] = value_type
+
+    return {key: type_name or "string" for key, type_name in types.items()}
+
 
 def infer_schema(
     records: list[dict[str, Any]], max_samples: int = 5
 ) -> dict[str, dict[str, Any]]:
     """Collect schema information from parsed records.
 
-    Note: This does not perform type inference. All values are treated
-    as strings in DuckDB queries. This function provides metadata about
-    what properties exist and their sample values.
+    The type of each property is the DuckDB-facing type used by queries
+    (see infer_type). Properties with mixed types are reported as "string".
 
     Args:
         records: List of parsed frontmatter records.
         max_samples: Maximum number of sample values to include.
 
     Returns:
-        Schema dict with count, nullable, sample_values for each property.
+        Schema dict with type, count, nullable, sample_values for each property.
     """
-    schema: dict[str, dict[str, Any]] = {}
-    property_values: dict[str, list[Any]] = {}
+    # Running state per property, filled in a single pass over the records
+    stats: dict[str, dict[str, Any]] = {}
 
     for record in records:
         for key, value in record.items():
             if key == "path":
                 continue
-            if key not in property_values:
-                property_values[key] = []
-            property_values[key].append(value)
+            prop = stats.get(key)
+            if prop is None:
+                prop = {
+                    "count": 0,
+                    "type": None,
+                    "value_type": None,
+                    "seen": set(),
+                    "samples": [],
+                }
+                stats[key] = prop
+            if value is None:
+                continue
+
+            prop["count"] += 1
+            value_type = type(value)
+
+            # Repeating the previous value's type cannot change the result
+            # for the plain scalar types in _TYPE_MAP
+            if prop["type"] != "string" and (
+                value_type is not prop["value_type"] or value_type not in _TYPE_MAP
+            ):
+                prop["type"] = _merge_type(prop["type"], infer_type(value))
+                prop["value_type"] = value_type
+
+            # Collect unique sample values. The type is part of the key so
+            # that e.g. 1 and True stay distinct.
+            samples = prop["samples"]
+            if len(samples) < max_samples:
+                seen = prop["seen"]
+                if value_type is list or value_type is dict:
+                    # Unhashable values are compared by repr
+                    sample_key: Any = repr(value)
+                else:
+                    sample_key = (value_type, value)
+                try:
+                    is_new = sample_key not in seen
+                except TypeError:
+                    sample_key = repr(value)
+                    is_new = sample_key not in seen
+                if is_new:
+                    seen.add(sample_key)
+                    samples.append(value)
 
     total_files = len(records)
 
-    for prop, values in property_values.items():
-        non_null_values = [v for v in values if v is not None]
-        count = len(non_null_values)
-
-        # Detect if values are arrays
-        is_array = any(isinstance(v, list) for v in non_null_values)
-
-        # Collect unique sample values
-        seen: set[str] = set()
-        samples: list[Any] = []
-        for v in non_null_values:
-            key = str(v)
-            if key not in seen and len(samples) < max_samples:
-                seen.add(key)
-                samples.append(v)
-
-        schema[prop] = {
-            "type": "array" if is_array else "string",
-            "count": count,
-            "nullable": count < total_files,
-            "sample_values": samples,
+    return {
+        key: {
+            "type": prop["type"] or "string",
+            "count": prop["count"],
+            "nullable": prop["count"] < total_files,
+            "sample_values": prop["samples"],
         }
-
-    return schema
+        for key, prop in stats.items()
+    }
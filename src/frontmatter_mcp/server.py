@@ -1,20 +1,35 @@
 """MCP Server implementation using FastMCP."""
 
 import glob as globmodule
+import os
+import stat
 import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import frontmatter
 from mcp.server.fastmcp import FastMCP
 
-from frontmatter_mcp.frontmatter import parse_files, update_file
+from frontmatter_mcp.frontmatter import RACY_WINDOW_NS, parse_files, update_file
 from frontmatter_mcp.query import execute_query
 from frontmatter_mcp.schema import infer_schema
 
 # Global base directory
 _base_dir: Path | None = None
 
+# Maximum number of glob patterns whose matches are remembered
+GLOB_CACHE_SIZE = 256
+
+# Glob pattern -> (mtime_ns of each directory the matches depend on, matches)
+_glob_cache: OrderedDict[str, tuple[dict[str, int | None], tuple[str, ...]]] = (
+    OrderedDict()
+)
+_glob_cache_lock = threading.Lock()
+
 mcp = FastMCP("frontmatter-mcp")
 
 
@@ -25,12 +40,169 @@ def get_base_dir() -> Path:
     return _base_dir
 
 
-def collect_files(glob_pattern: str) -> list[Path]:
-    """Collect files matching the glob pattern."""
+def _dir_mtime(path: str) -> int | None:
+    """Get the mtime of a directory, or None if it cannot be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _snapshot_dirs(pattern: str) -> dict[str, int | None]:
+    """Record the mtime of every directory the glob's matches depend on.
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed in it, so the matches stay valid while none of these change.
+    """
+    head, tail = os.path.split(pattern)
+    if not globmodule.has_magic(head) and "**" not in tail:
+        return {head: _dir_mtime(head)}
+
+    parts = head.split(os.sep)
+    literal = 0
+    while literal < len(parts) and not globmodule.has_magic(parts[literal]):
+        literal += 1
+    root = os.sep.join(parts[:literal]) or os.sep
+
+    if "**" not in pattern:
+        # Without '**', glob only lists the directories matched by each
+        # prefix of the directory part
+        mtimes = {root: _dir_mtime(root)}
+        for depth in range(literal + 1, len(parts) + 1):
+            for dirpath in globmodule.iglob(os.sep.join(parts[:depth])):
+                try:
+                    st = os.stat(dirpath)
+                except OSError:
+                    continue
+                if stat.S_ISDIR(st.st_mode):
+                    mtimes[dirpath] = st.st_mtime_ns
+        return mtimes
+
+    # glob skips hidden directories for wildcards, but a pattern component
+    # starting with '.' (literal or not) can still match inside them
+    include_hidden = any(
+        part.startswith(".") for part in pattern.split(os.sep)[literal:]
+    )
+
+    # Walk everything below the pattern's literal prefix
+    mtimes = {}
+    for dirpath, dirnames, _ in os.walk(root, followlinks=True):
+        mtimes[dirpath] = _dir_mtime(dirpath)
+        if not include_hidden:
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+    if not mtimes:
+        mtimes[root] = None
+    return mtimes
+
+
+def _split_suffix_pattern(pattern: str) -> tuple[str, str] | None:
+    """Split a '<root>/**/*<suffix>' pattern into (root, suffix).
+
+    Returns None for any other pattern, or when the filesystem is case
+    insensitive and a plain suffix comparison would differ from glob.
+    """
+    head, tail = os.path.split(pattern)
+    root, recurse = os.path.split(head)
+    if recurse != "**" or not tail.startswith("*"):
+        return None
+    suffix = tail[1:]
+    if globmodule.has_magic(root) or globmodule.has_magic(suffix):
+        return None
+    if os.path.normcase("A") != "A":
+        return None
+    return root, suffix
+
+
+def _walk_suffix(
+    root: str, suffix: str, mtimes: dict[str, int | None]
+) -> Iterator[str]:
+    """Yield files below root whose names end with suffix.
+
+    Equivalent to glob's '<root>/**/*<suffix>' followed by an isfile check,
+    including its order and skipping of hidden entries, but lists each
+    directory once with os.scandir. The mtime of every visited directory
+    is recorded in mtimes before it is listed.
+    """
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        mtimes[dirpath] = _dir_mtime(dirpath)
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: list[str] = []
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            if name.endswith(suffix) and entry.is_file():
+                yield entry.path
+            elif entry.is_dir():
+                subdirs.append(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+def _glob_and_cache(pattern: str) -> Iterator[str]:
+    """Glob for files, caching the matches once the walk completes."""
+    started_ns = time.time_ns()
+
+    mtimes: dict[str, int | None]
+    suffix_pattern = _split_suffix_pattern(pattern)
+    if suffix_pattern is not None:
+        mtimes = {}
+        files = _walk_suffix(*suffix_pattern, mtimes)
+    else:
+        mtimes = _snapshot_dirs(pattern)
+        files = (
+            p for p in globmodule.iglob(pattern, recursive=True) if os.path.isfile(p)
+        )
+
+    matches: list[str] = []
+    for p in files:
+        matches.append(p)
+        yield p
+
+    # Directories modified within RACY_WINDOW_NS may change again without
+    # their mtime moving, so such results are not cached
+    racy = any(
+        m is not None and m > started_ns - RACY_WINDOW_NS for m in mtimes.values()
+    )
+    if racy:
+        return
+    with _glob_cache_lock:
+        _glob_cache[pattern] = (mtimes, tuple(matches))
+        _glob_cache.move_to_end(pattern)
+        while len(_glob_cache) > GLOB_CACHE_SIZE:
+            _glob_cache.popitem(last=False)
+
+
+def collect_files(glob_pattern: str) -> Iterator[str]:
+    """Collect files matching the glob pattern.
+
+    Matches are yielded as the directory walk finds them, so callers can
+    start processing before the walk completes. Results are cached per
+    pattern and reused while none of the directories involved has changed.
+
+    Returns:
+        Iterator of absolute paths as plain strings.
+    """
     base = get_base_dir()
-    pattern = str(base / glob_pattern)
-    matches = globmodule.glob(pattern, recursive=True)
-    return [Path(p) for p in matches if Path(p).is_file()]
+    pattern = os.path.join(base, glob_pattern)
+
+    with _glob_cache_lock:
+        cached = _glob_cache.get(pattern)
+        if cached is not None:
+            _glob_cache.move_to_end(pattern)
+
+    if cached is not None:
+        mtimes, matches = cached
+        if all(_dir_mtime(d) == m for d, m in mtimes.items()):
+            return iter(matches)
+
+    return _glob_and_cache(pattern)
 
 
 @mcp.tool()
@@ -68,7 +240,9 @@ def query(glob: str, sql: str) -> dict[str, Any]:
             properties plus 'path'.
 
     Returns:
-        Dict with results array, row_count, and columns.
+        Dict with results array, row_count, and columns. Results are capped at
+        a fixed maximum number of rows; 'truncated' is true when rows were
+        dropped.
     """
     base = get_base_dir()
     paths = collect_files(glob)
@@ -80,6 +254,8 @@ def query(glob: str, sql: str) -> dict[str, Any]:
         "row_count": query_result["row_count"],
         "columns": query_result["columns"],
     }
+    if query_result.get("truncated"):
+        result["truncated"] = True
     if warnings:
         result["warnings"] = warnings
 
@@ -150,7 +326,7 @@ def batch_update(
     warnings: list[str] = []
 
     for file_path in paths:
-        abs_path = file_path.resolve()
+        abs_path = Path(file_path).resolve()
         try:
             abs_path.relative_to(base)
         except ValueError:
@@ -205,7 +381,7 @@ def batch_array_add(
     warnings: list[str] = []
 
     for file_path in paths:
-        abs_path = file_path.resolve()
+        abs_path = Path(file_path).resolve()
         try:
             rel_path = str(abs_path.relative_to(base))
         except ValueError:
@@ -280,7 +456,7 @@ def batch_array_remove(
     warnings: list[str] = []
 
     for file_path in paths:
-        abs_path = file_path.resolve()
+        abs_path = Path(file_path).resolve()
         try:
             rel_path = str(abs_path.relative_to(base))
         except ValueError:
@@ -354,7 +530,7 @@ def batch_array_replace(
     warnings: list[str] = []
 
     for file_path in paths:
-        abs_path = file_path.resolve()
+        abs_path = Path(file_path).resolve()
         try:
             rel_path = str(abs_path.relative_to(base))
         except ValueError:
@@ -428,7 +604,7 @@ def batch_array_sort(
     warnings: list[str] = []
 
     for file_path in paths:
-        abs_path = file_path.resolve()
+        abs_path = Path(file_path).resolve()
         try:
             rel_path = str(abs_path.relative_to(base))
         except ValueError:
@@ -1,8 +1,15 @@
 """Tests for frontmatter module."""
 
+import os
+import time
 from datetime import date
 from pathlib import Path
+from typing import Any
 
+import frontmatter
+import pytest
+
+import frontmatter_mcp.frontmatter as fm_module
 from frontmatter_mcp.frontmatter import (
     parse_file,
     parse_files,
@@ -27,7 +34,7 @@ summary: Test summary
 
         assert result["path"] == "test.md"
         assert result["date"] == date(2025, 11, 27)
-        assert result["tags"] == ["mcp", "python"]
+        assert result["tags"] == ("mcp", "python")
         assert result["summary"] == "Test summary"
 
     def test_parse_file_without_frontmatter(self, tmp_path: Path) -> None:
@@ -53,6 +60,74 @@ title: Nested
 
         assert result["path"] == "atoms/sub/nested.md"
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\ntitle: Test\n---\n# Body\n---\nnot: metadata\n",
+            "---\ntitle: No trailing newline\n---",
+            "---\n---\n# Empty header\n",
+            "---\ntitle: Trailing spaces\n---   \n",
+            "---\ntitle: Long dashes\n-----\n",
+            "---\n- not\n- a mapping\n---\n",
+            "---\ntitle: Unterminated\n",
+            "---\r\ntitle: CRLF\r\n---\r\n",
+            "\n---\ntitle: Leading blank line\n---\n",
+            "# Heading\n---\ntitle: Not frontmatter\n---\n",
+            "",
+            "--\n",
+            '{\n"title": "JSON"\n}\n',
+            "\ufeff---\ntitle: BOM\n---\n",
+            "---\nbody: |\n" + "  line\n" * 2000 + "---\n",
+            "---\nbody: |\n" + "  line\n" * 2000,
+        ],
+    )
+    def test_parse_file_matches_python_frontmatter(
+        self, tmp_path: Path, content: str
+    ) -> None:
+        """Parsed metadata is identical to python-frontmatter's."""
+        md_file = tmp_path / "test.md"
+        md_file.write_bytes(content.encode())
+
+        result = parse_file(md_file, tmp_path)
+        del result["path"]
+
+        assert result == frontmatter.load(md_file).metadata
+
+    def test_parse_file_reflects_modification(self, tmp_path: Path) -> None:
+        """Cached metadata is invalidated when the file changes."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text("---\ntitle: Before\n---\n")
+        assert parse_file(md_file, tmp_path)["title"] == "Before"
+
+        md_file.write_text("---\ntitle: Changed\n---\n")
+        assert parse_file(md_file, tmp_path)["title"] == "Changed"
+
+    def test_parse_file_same_size_rewrite_within_racy_window(
+        self, tmp_path: Path
+    ) -> None:
+        """Same-size rewrites that keep a recent mtime are not served stale."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text("---\nstatus: todo\n---\n")
+        st = md_file.stat()
+        assert parse_file(md_file, tmp_path)["status"] == "todo"
+
+        md_file.write_text("---\nstatus: done\n---\n")
+        os.utime(md_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert parse_file(md_file, tmp_path)["status"] == "done"
+
+    def test_parse_file_result_is_independent(self, tmp_path: Path) -> None:
+        """Mutating a parsed record does not affect later parses."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text("---\nlinks:\n  related: [a]\n---\n")
+
+        first = parse_file(md_file, tmp_path)
+        first["links"]["related"].append("mutated")
+        first["extra"] = True
+
+        second = parse_file(md_file, tmp_path)
+        assert second["links"] == {"related": ["a"]}
+        assert "extra" not in second
+
 
 class TestParseFiles:
     """Tests for parse_files function."""
@@ -96,6 +171,77 @@ invalid: yaml: content: [
         assert warnings[0]["path"] == "invalid.md"
         assert "error" in warnings[0]
 
+    def test_parse_files_from_iterator(self, tmp_path: Path) -> None:
+        """Paths can be supplied lazily."""
+        for name in ["a.md", "b.md"]:
+            (tmp_path / name).write_text(f"---\ntitle: {name}\n---\n")
+
+        paths = (tmp_path / name for name in ["a.md", "b.md"])
+        records, warnings = parse_files(paths, tmp_path)
+
+        assert [r["title"] for r in records] == ["a.md", "b.md"]
+        assert warnings == []
+
+    def test_parse_files_outside_base_dir(self, tmp_path: Path) -> None:
+        """Files outside the base directory are reported as warnings."""
+        base_dir = tmp_path / "base"
+        base_dir.mkdir()
+        inside = base_dir / "inside.md"
+        inside.write_text("---\ntitle: Inside\n---\n")
+        outside = tmp_path / "outside.md"
+        outside.write_text("---\ntitle: Outside\n---\n")
+
+        records, warnings = parse_files([str(inside), str(outside)], base_dir)
+
+        assert [r["path"] for r in records] == ["inside.md"]
+        assert len(warnings) == 1
+        assert warnings[0]["path"] == "../outside.md"
+
+    def test_parse_files_caches_large_scans(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unchanged files are parsed once even in scans of many files."""
+        past = time.time() - 60
+        paths = []
+        for i in range(5000):
+            md_file = tmp_path / f"{i:04d}.md"
+            md_file.write_text(f"---\nindex: {i}\n---\n")
+            os.utime(md_file, (past, past))
+            paths.append(str(md_file))
+        parse_files(paths, tmp_path)
+
+        loaded: list[str] = []
+        fast_load = fm_module._fast_load
+
+        def counting_load(path: str) -> dict[str, Any]:
+            loaded.append(path)
+            return fast_load(path)
+
+        monkeypatch.setattr(fm_module, "_fast_load", counting_load)
+        records, _ = parse_files(paths, tmp_path)
+
+        assert len(records) == 5000
+        assert loaded == []
+
+    def test_parse_files_preserves_order(self, tmp_path: Path) -> None:
+        """Records and warnings keep the order of the input paths."""
+        # More paths than MIN_PARALLEL_FILES, so the thread pool is used
+        paths = []
+        for i in range(200):
+            md_file = tmp_path / f"{i:03d}.md"
+            if i % 10 == 0:
+                md_file.write_text("---\ninvalid: yaml: content: [\n---\n")
+            else:
+                md_file.write_text(f"---\nindex: {i}\n---\n")
+            paths.append(md_file)
+
+        records, warnings = parse_files(paths, tmp_path)
+
+        assert [r["index"] for r in records] == [i for i in range(200) if i % 10]
+        assert [w["path"] for w in warnings] == [
+            f"{i:03d}.md" for i in range(0, 200, 10)
+        ]
+
 
 class TestUpdateFile:
     """Tests for update_file function."""
@@ -1,7 +1,11 @@
 """Tests for DuckDB query module."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
+import duckdb
+import pytest
+
 from frontmatter_mcp.query import execute_query
 
 
@@ -60,17 +64,14 @@ class TestExecuteQuery:
         assert result["results"][1]["path"] == "b.md"
 
     def test_array_contains(self) -> None:
-        """Filter by array containment using from_json."""
+        """Filter by array containment on a native list column."""
         records = [
             {"path": "a.md", "tags": ["mcp", "python"]},
             {"path": "b.md", "tags": ["duckdb"]},
             {"path": "c.md", "tags": ["mcp", "duckdb"]},
         ]
-        # Arrays are JSON-encoded strings, use from_json to parse
         result = execute_query(
-            records,
-            """SELECT path FROM files
-               WHERE list_contains(from_json(tags, '["VARCHAR"]'), 'mcp')""",
+            records, "SELECT path FROM files WHERE list_contains(tags, 'mcp')"
         )
 
         assert result["row_count"] == 2
@@ -91,17 +92,16 @@ class TestExecuteQuery:
         assert result["results"][0]["count"] == 3
 
     def test_unnest_tags(self) -> None:
-        """Unnest array and aggregate using from_json."""
+        """Unnest array and aggregate."""
         records = [
             {"path": "a.md", "tags": ["mcp", "python"]},
             {"path": "b.md", "tags": ["mcp"]},
         ]
-        # Arrays are JSON-encoded strings, use from_json then unnest
         result = execute_query(
             records,
             """
             SELECT tag, COUNT(*) AS count
-            FROM files, UNNEST(from_json(tags, '["VARCHAR"]')) AS t(tag)
+            FROM files, UNNEST(tags) AS t(tag)
             GROUP BY tag
             ORDER BY count DESC
             """,
@@ -111,6 +111,21 @@ class TestExecuteQuery:
         assert result["results"][0]["tag"] == "mcp"
         assert result["results"][0]["count"] == 2
 
+    def test_max_rows_truncates(self) -> None:
+        """Results beyond max_rows are dropped and flagged."""
+        records = [{"path": f"{i}.md"} for i in range(5)]
+
+        result = execute_query(
+            records, "SELECT path FROM files ORDER BY path", max_rows=3
+        )
+        assert result["row_count"] == 3
+        assert [r["path"] for r in result["results"]] == ["0.md", "1.md", "2.md"]
+        assert result["truncated"] is True
+
+        result = execute_query(records, "SELECT path FROM files", max_rows=5)
+        assert result["row_count"] == 5
+        assert "truncated" not in result
+
     def test_empty_records(self) -> None:
         """Handle empty records list."""
         result = execute_query([], "SELECT * FROM files")
@@ -118,6 +133,31 @@ class TestExecuteQuery:
         assert result["row_count"] == 0
         assert result["results"] == []
 
+    def test_concurrent_queries_are_isolated(self) -> None:
+        """Concurrent queries each see only their own records."""
+
+        def run(n: int) -> list[str]:
+            records = [{"path": f"{n}-{i}.md"} for i in range(n)]
+            result = execute_query(records, "SELECT path FROM files ORDER BY path")
+            return [r["path"] for r in result["results"]]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outputs = list(executor.map(run, range(1, 33)))
+
+        for n, paths in enumerate(outputs, start=1):
+            assert paths == sorted(f"{n}-{i}.md" for i in range(n))
+
+    def test_queries_do_not_share_state(self) -> None:
+        """Tables and macros created by one query are gone in the next."""
+        records = [{"path": "a.md", "title": "A"}]
+        execute_query(records, "CREATE TABLE leaked AS SELECT * FROM files")
+        execute_query(records, "CREATE MACRO twice(x) AS x * 2")
+
+        with pytest.raises(duckdb.CatalogException):
+            execute_query(records, "SELECT * FROM leaked")
+        with pytest.raises(duckdb.CatalogException):
+            execute_query(records, "SELECT twice(1) FROM files")
+
     def test_null_handling(self) -> None:
         """Handle NULL values in records."""
         records = [
@@ -132,6 +172,49 @@ class TestExecuteQuery:
         assert "c.md" in paths
         assert "a.md" not in paths
 
+    def test_native_column_types(self) -> None:
+        """Columns with consistent types are passed with native types."""
+        records = [
+            {
+                "path": "a.md",
+                "date": date(2025, 11, 27),
+                "count": 3,
+                "ratio": 0.5,
+                "draft": True,
+                "tags": ["mcp"],
+            },
+            {"path": "b.md", "date": date(2025, 11, 26), "count": 12, "ratio": 2},
+        ]
+        result = execute_query(
+            records,
+            """SELECT typeof(date) AS date, typeof(count) AS count,
+                      typeof(ratio) AS ratio, typeof(draft) AS draft,
+                      typeof(tags) AS tags
+               FROM files LIMIT 1""",
+        )
+
+        assert result["results"][0] == {
+            "date": "DATE",
+            "count": "BIGINT",
+            "ratio": "DOUBLE",
+            "draft": "BOOLEAN",
+            "tags": "VARCHAR[]",
+        }
+
+        # Numeric comparison works without TRY_CAST
+        result = execute_query(records, "SELECT path FROM files WHERE count > 5")
+        assert [r["path"] for r in result["results"]] == ["b.md"]
+
+    def test_out_of_range_integer_falls_back_to_string(self) -> None:
+        """Values that do not fit the inferred type are passed as strings."""
+        records = [
+            {"path": "a.md", "id": 1},
+            {"path": "b.md", "id": 2**70},
+        ]
+        result = execute_query(records, "SELECT path, id FROM files ORDER BY path")
+
+        assert [r["id"] for r in result["results"]] == ["1", str(2**70)]
+
     def test_templater_expressions_mixed_with_dates(self) -> None:
         """Handle Templater expressions mixed with real dates.
 
@@ -139,8 +222,8 @@ class TestExecuteQuery:
         Templater expressions like '<% tp.date.now("YYYY-MM-DD") %>'
         alongside real date values from normal files.
 
-        The key assertion is that no type error occurs - all values are
-        treated as strings and the query executes successfully.
+        The key assertion is that no type error occurs - the mixed column
+        is passed as strings and the query executes successfully.
         """
         records = [
             {"path": "a.md", "date": date(2025, 11, 27)},
@@ -148,7 +231,7 @@ class TestExecuteQuery:
             # Template file with unexpanded Templater expression
             {"path": "template.md", "date": '<% tp.date.now("YYYY-MM-DD") %>'},
         ]
-        # Query should not error - all values are strings now
+        # Query should not error - the date column falls back to strings
         # Note: String comparison means '<% ...' sorts after '2025-...'
         result = execute_query(records, "SELECT path, date FROM files")
 
@@ -169,7 +252,7 @@ class TestExecuteQuery:
     def test_mixed_type_values_in_same_column(self) -> None:
         """Handle mixed types in the same column.
 
-        All values are serialized to strings, so queries work regardless
+        Mixed columns are serialized to strings, so queries work regardless
         of the original Python type.
         """
         records = [
@@ -178,10 +261,11 @@ class TestExecuteQuery:
             {"path": "c.md", "value": 3.14},
             {"path": "d.md", "value": True},
             {"path": "e.md", "value": ["a", "b"]},
+            {"path": "f.md", "value": ("c", "d")},
         ]
         result = execute_query(records, "SELECT path, value FROM files")
 
-        assert result["row_count"] == 5
+        assert result["row_count"] == 6
         # All values are strings
         values = {r["path"]: r["value"] for r in result["results"]}
         assert values["a.md"] == "string"
@@ -189,3 +273,4 @@ class TestExecuteQuery:
         assert values["c.md"] == "3.14"
         assert values["d.md"] == "True"
         assert values["e.md"] == '["a", "b"]'
+        assert values["f.md"] == '["c", "d"]'
@@ -1,8 +1,8 @@
 """Tests for schema module."""
 
-from datetime import date
+from datetime import date, datetime, timezone
 
-from frontmatter_mcp.schema import infer_schema
+from frontmatter_mcp.schema import infer_column_types, infer_schema
 
 
 class TestInferSchema:
@@ -16,15 +16,26 @@ class TestInferSchema:
         ]
         schema = infer_schema(records)
 
-        # All non-array values are reported as "string"
-        assert schema["date"]["type"] == "string"
+        assert schema["date"]["type"] == "date"
         assert schema["date"]["count"] == 2
         assert schema["date"]["nullable"] is False
 
-        # Arrays are detected
+        # Arrays of strings are detected
         assert schema["tags"]["type"] == "array"
         assert schema["tags"]["count"] == 2
 
+    def test_tuple_arrays(self) -> None:
+        """Arrays parsed as tuples are detected and sampled by value."""
+        records = [
+            {"path": "a.md", "tags": ("mcp", "python")},
+            {"path": "b.md", "tags": ("mcp", "python")},
+            {"path": "c.md", "tags": ("duckdb",)},
+        ]
+        schema = infer_schema(records)
+
+        assert schema["tags"]["type"] == "array"
+        assert schema["tags"]["sample_values"] == [("mcp", "python"), ("duckdb",)]
+
     def test_nullable_detection(self) -> None:
         """Detect nullable fields when some records lack the property."""
         records = [
@@ -37,6 +48,49 @@ class TestInferSchema:
         assert schema["summary"]["nullable"] is True
         assert schema["summary"]["count"] == 1
 
+    def test_scalar_types(self) -> None:
+        """Detect native scalar types."""
+        records = [
+            {
+                "path": "a.md",
+                "count": 1,
+                "ratio": 0.5,
+                "draft": True,
+                "created": datetime(2025, 11, 27, 10, 0),
+            },
+            {"path": "b.md", "count": 2, "ratio": 1, "draft": False},
+        ]
+        schema = infer_schema(records)
+
+        assert schema["count"]["type"] == "integer"
+        # Integers and doubles widen to double
+        assert schema["ratio"]["type"] == "double"
+        assert schema["draft"]["type"] == "boolean"
+        assert schema["created"]["type"] == "timestamp"
+
+    def test_mixed_types_are_string(self) -> None:
+        """Properties with incompatible types are reported as string."""
+        records = [
+            {"path": "a.md", "date": date(2025, 11, 27), "tags": ["a"]},
+            {"path": "b.md", "date": '<% tp.date.now("YYYY-MM-DD") %>', "tags": [1]},
+        ]
+        schema = infer_schema(records)
+
+        assert schema["date"]["type"] == "string"
+        # Arrays must contain only strings
+        assert schema["tags"]["type"] == "string"
+
+    def test_timezone_aware_timestamp_is_string(self) -> None:
+        """A timezone-aware datetime after naive ones makes the column string."""
+        records = [
+            {"path": "a.md", "created": datetime(2025, 11, 27, 10, 0)},
+            {"path": "b.md", "created": datetime(2025, 11, 27, 10, 0)},
+            {"path": "c.md", "created": datetime(2025, 11, 27, tzinfo=timezone.utc)},
+        ]
+
+        assert infer_schema(records)["created"]["type"] == "string"
+        assert infer_column_types(records)["created"] == "string"
+
     def test_sample_values_unique(self) -> None:
         """Sample values are unique and limited by max_samples."""
         records = [
@@ -57,3 +111,31 @@ class TestInferSchema:
 
         assert "path" not in schema
         assert "title" in schema
+
+    def test_null_values(self) -> None:
+        """Explicit nulls count as missing but keep the property in the schema."""
+        records = [
+            {"path": "a.md", "summary": None, "tags": None},
+            {"path": "b.md", "summary": None, "tags": ["python"]},
+        ]
+        schema = infer_schema(records)
+
+        assert schema["summary"]["count"] == 0
+        assert schema["summary"]["nullable"] is True
+        assert schema["summary"]["sample_values"] == []
+
+        # Type comes from the non-null values only
+        assert schema["tags"]["type"] == "array"
+        assert schema["tags"]["sample_values"] == [["python"]]
+
+    def test_sample_values_dedup_by_value_and_type(self) -> None:
+        """Samples are deduplicated by value, keeping distinct types apart."""
+        records = [
+            {"path": "a.md", "value": 1, "tags": ["a", "b"]},
+            {"path": "b.md", "value": True, "tags": ["a", "b"]},
+            {"path": "c.md", "value": 1, "tags": ["c"]},
+        ]
+        schema = infer_schema(records)
+
+        assert schema["value"]["sample_values"] == [1, True]
+        assert schema["tags"]["sample_values"] == [["a", "b"], ["c"]]
@@ -1,8 +1,11 @@
 """Tests for MCP server module."""
 
 import datetime
+import os
 import tempfile
+import time
 from pathlib import Path
+from typing import Any
 
 import frontmatter
 import pytest
@@ -50,6 +53,112 @@ summary: A summary
         server_module._base_dir = None
 
 
+def _age_dirs(base: Path) -> None:
+    """Move directory mtimes into the past so glob results can be cached."""
+    past = time.time() - 60
+    for dirpath, _, _ in os.walk(base):
+        os.utime(dirpath, (past, past))
+
+
+class TestCollectFiles:
+    """Tests for collect_files function."""
+
+    def test_recursive_glob(self, temp_base_dir: Path) -> None:
+        """Collect files recursively as absolute paths."""
+        paths = sorted(server_module.collect_files("**/*.md"))
+        assert paths == [
+            str(temp_base_dir / "a.md"),
+            str(temp_base_dir / "b.md"),
+            str(temp_base_dir / "subdir" / "c.md"),
+        ]
+
+    def test_recursive_suffix_walk_matches_glob(self, temp_base_dir: Path) -> None:
+        """The scandir walk for '**/*.ext' returns exactly what glob returns."""
+        (temp_base_dir / "subdir" / "deep" / "deeper").mkdir(parents=True)
+        (temp_base_dir / "subdir" / "deep" / "deeper" / "d.md").write_text("")
+        (temp_base_dir / "subdir" / "notes.txt").write_text("")
+        (temp_base_dir / "subdir" / ".hidden.md").write_text("")
+        (temp_base_dir / ".obsidian").mkdir()
+        (temp_base_dir / ".obsidian" / "e.md").write_text("")
+        (temp_base_dir / "dir.md").mkdir()
+        (temp_base_dir / "dir.md" / "f.md").write_text("")
+        (temp_base_dir / "linked").symlink_to(temp_base_dir / "subdir")
+
+        for glob_pattern in ["**/*.md", "subdir/**/*.md", "**/*", "missing/**/*.md"]:
+            pattern = os.path.join(temp_base_dir, glob_pattern)
+            expected = [
+                p
+                for p in server_module.globmodule.iglob(pattern, recursive=True)
+                if os.path.isfile(p)
+            ]
+            assert list(server_module.collect_files(glob_pattern)) == expected
+
+    def test_cached_until_directory_changes(
+        self, temp_base_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unchanged directories reuse the previous matches."""
+        _age_dirs(temp_base_dir)
+        first = list(server_module.collect_files("**/*.md"))
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("glob should not run")
+
+        with monkeypatch.context() as m:
+            m.setattr(server_module.globmodule, "iglob", fail)
+            assert list(server_module.collect_files("**/*.md")) == first
+
+        # Adding a file in a nested directory invalidates the cache
+        (temp_base_dir / "subdir" / "d.md").write_text("---\ntitle: D\n---\n")
+        paths = list(server_module.collect_files("**/*.md"))
+        assert str(temp_base_dir / "subdir" / "d.md") in paths
+
+    def test_removed_file_not_returned(self, temp_base_dir: Path) -> None:
+        """Deleting a file invalidates cached matches."""
+        _age_dirs(temp_base_dir)
+        assert len(list(server_module.collect_files("*.md"))) == 2
+
+        (temp_base_dir / "b.md").unlink()
+        assert list(server_module.collect_files("*.md")) == [
+            str(temp_base_dir / "a.md")
+        ]
+
+    @pytest.mark.parametrize(
+        "glob_pattern", ["**/.obsidian/*.json", "*/.obsidian/*.json"]
+    )
+    def test_literal_hidden_directory_after_wildcard(
+        self, temp_base_dir: Path, glob_pattern: str
+    ) -> None:
+        """Hidden directories named literally in the pattern are watched."""
+        hidden = temp_base_dir / "x" / ".obsidian"
+        hidden.mkdir(parents=True)
+        (hidden / "a.json").write_text("{}")
+        _age_dirs(temp_base_dir)
+        assert list(server_module.collect_files(glob_pattern)) == [
+            str(hidden / "a.json")
+        ]
+
+        (hidden / "b.json").write_text("{}")
+        assert sorted(server_module.collect_files(glob_pattern)) == [
+            str(hidden / "a.json"),
+            str(hidden / "b.json"),
+        ]
+
+    def test_snapshot_without_recursion_stops_at_pattern_depth(
+        self, temp_base_dir: Path
+    ) -> None:
+        """Patterns without '**' only watch directories glob lists."""
+        (temp_base_dir / "subdir" / "deep").mkdir()
+        (temp_base_dir / "other").mkdir()
+        (temp_base_dir / "other" / "index.md").write_text("")
+
+        pattern = os.path.join(temp_base_dir, "*", "index.md")
+        assert set(server_module._snapshot_dirs(pattern)) == {
+            str(temp_base_dir),
+            str(temp_base_dir / "subdir"),
+            str(temp_base_dir / "other"),
+        }
+
+
 class TestQueryInspect:
     """Tests for query_inspect tool."""
 
@@ -87,21 +196,19 @@ class TestQuery:
         assert "b.md" in paths
 
     def test_tag_contains(self, temp_base_dir: Path) -> None:
-        """Filter by tag using from_json."""
+        """Filter by tag."""
         result = server_module.query(
-            "**/*.md",
-            """SELECT path FROM files
-               WHERE list_contains(from_json(tags, '["VARCHAR"]'), 'python')""",
+            "**/*.md", "SELECT path FROM files WHERE list_contains(tags, 'python')"
         )
         assert result["row_count"] == 2
 
     def test_tag_aggregation(self, temp_base_dir: Path) -> None:
-        """Aggregate tags using from_json."""
+        """Aggregate tags."""
         result = server_module.query(
             "**/*.md",
             """
             SELECT tag, COUNT(*) AS count
-            FROM files, UNNEST(from_json(tags, '["VARCHAR"]')) AS t(tag)
+            FROM files, UNNEST(tags) AS t(tag)
             GROUP BY tag
             ORDER BY count DESC
             """,